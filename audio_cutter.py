@@ -1,47 +1,120 @@
 #!/usr/bin/env python3
 
 import argparse
+import contextlib
+import functools
+import hashlib
+import importlib
+import io
+import mmap
 import os
+import re
+import shutil
+import subprocess
 import sys
+import tempfile
 import wave
 import struct
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
 from pathlib import Path
 
-try:
-    from pydub import AudioSegment
-    PYDUB_AVAILABLE = True
-except ImportError:
-    PYDUB_AVAILABLE = False
-    print("Warning: pydub not available. Only WAV files supported.", file=sys.stderr)
+# PyAV and pydub take a noticeable time to import, so they are only loaded
+# once a file actually needs them; --help and WAV-only runs never pay for it
+@functools.lru_cache(maxsize=None)
+def _try_import_av():
+    try:
+        return importlib.import_module('av')
+    except ImportError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _try_import_pydub():
+    try:
+        return importlib.import_module('pydub')
+    except ImportError:
+        return None
+
+
+FFMPEG_PATH = shutil.which("ffmpeg")
+FFPROBE_PATH = shutil.which("ffprobe")
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# Size of the canonical PCM header written by the wave module
+WAV_HEADER_SIZE = 44
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+# Linux can sendfile() between regular files; other platforms only to sockets
+SENDFILE_TO_FILES = sys.platform.startswith('linux') and hasattr(os, 'sendfile')
+
+# Default cap on the total size of a --cache-dir
+DEFAULT_CACHE_LIMIT = 2 * 1024 * 1024 * 1024
+
+# Lossless formats that are re-encoded rather than packet-copied: PCM WAV is
+# cut sample-accurately instead of rounding to FFmpeg's packet size, and a
+# copied FLAC stream would keep the source's total length in STREAMINFO
+NO_STREAM_COPY_FORMATS = {'wav', 'flac'}
+
+# Codecs pydub picks for formats whose muxer default differs
+# (PyAV's ogg muxer defaults to FLAC, for example)
+AV_DEFAULT_CODECS = {'ogg': 'libvorbis', 'opus': 'libopus'}
 
 
 class AudioCutter:
-    def __init__(self, input_file):
+    def __init__(self, input_file, cache_dir=None, cache_limit=DEFAULT_CACHE_LIMIT):
         self.input_file = Path(input_file)
         if not self.input_file.exists():
             raise FileNotFoundError(f"Audio file not found: {input_file}")
         
-        if PYDUB_AVAILABLE:
+        is_wav = str(self.input_file).lower().endswith('.wav')
+        if is_wav:
+            # PCM WAV needs no decoder; anything the header probe rejects
+            # (float or compressed WAV) is left to PyAV or pydub
             try:
-                self.audio = AudioSegment.from_file(str(self.input_file))
-                self.backend = 'pydub'
-            except Exception as e:
-                raise ValueError(f"Could not load audio file with pydub: {e}")
+                self._open_wave()
+                return
+            except ValueError:
+                if _try_import_av() is None and _try_import_pydub() is None:
+                    raise
+        
+        if cache_dir is not None and not is_wav:
+            # Work from a decoded WAV copy: after the first run every cut
+            # goes through the memory-mapped wave backend
+            self.source_file = self.input_file
+            self.input_file = _cached_wav(self.input_file, Path(cache_dir), cache_limit)
+            self._open_wave()
+        elif _try_import_av() is not None:
+            self.backend = 'av'
+            self._open_av()
+            # Only decoded by pydub for outputs PyAV cannot encode
+            self.audio = None
+        elif _try_import_pydub() is not None:
+            # Decoding is deferred until an operation actually needs samples;
+            # a header probe is enough for the duration checks.
+            self.audio = None
+            self.backend = 'pydub'
+            if not self._probe_stream_info():
+                self._ensure_loaded()
+                self.sample_rate = self.audio.frame_rate
+                self.channels = self.audio.channels
+                self.duration_ms = len(self.audio)
         else:
-            # Fallback to wave module for WAV files only
-            if not str(self.input_file).lower().endswith('.wav'):
-                raise ValueError("Only WAV files are supported without pydub. Install FFmpeg and pydub for other formats.")
-            
-            try:
-                self.wave_file = wave.open(str(self.input_file), 'rb')
-                self.sample_rate = self.wave_file.getframerate()
-                self.channels = self.wave_file.getnchannels()
-                self.sample_width = self.wave_file.getsampwidth()
-                self.total_frames = self.wave_file.getnframes()
-                self.duration_ms = int((self.total_frames / self.sample_rate) * 1000)
-                self.backend = 'wave'
-            except Exception as e:
-                raise ValueError(f"Could not load WAV file: {e}")
+            raise ValueError("Only WAV files are supported without PyAV or pydub. Install PyAV, or FFmpeg and pydub, for other formats.")
+    
+    def _open_wave(self):
+        try:
+            (self.sample_rate, self.channels, self.sample_width,
+             self.total_frames, self.data_offset) = _probe_wav_header(self.input_file)
+            self.duration_ms = self.total_frames * 1000 // self.sample_rate
+            self._bpf = self.channels * self.sample_width
+            # The file is only mapped once a cut needs the samples
+            self.mm = None
+            self.backend = 'wave'
+        except Exception as e:
+            raise ValueError(f"Could not load WAV file: {e}")
     
     def cut_from_front(self, duration_ms):
         if duration_ms <= 0:
@@ -49,8 +122,8 @@ class AudioCutter:
         if duration_ms >= self.get_duration():
             raise ValueError("Duration cannot be longer than the audio file")
         
-        if self.backend == 'pydub':
-            return self.audio[duration_ms:]
+        if self.backend in ('av', 'pydub'):
+            return [(duration_ms, self.get_duration())]
         else:
             return self._wav_cut_from_front(duration_ms)
     
@@ -60,8 +133,8 @@ class AudioCutter:
         if duration_ms >= self.get_duration():
             raise ValueError("Duration cannot be longer than the audio file")
         
-        if self.backend == 'pydub':
-            return self.audio[:-duration_ms]
+        if self.backend in ('av', 'pydub'):
+            return [(0, self.get_duration() - duration_ms)]
         else:
             return self._wav_cut_from_back(duration_ms)
     
@@ -73,10 +146,13 @@ class AudioCutter:
         if end_ms > self.get_duration():
             raise ValueError("End time cannot be beyond the audio length")
         
-        if self.backend == 'pydub':
-            before_cut = self.audio[:start_ms]
-            after_cut = self.audio[end_ms:]
-            return before_cut + after_cut
+        if self.backend in ('av', 'pydub'):
+            ranges = []
+            if start_ms > 0:
+                ranges.append((0, start_ms))
+            if end_ms < self.get_duration():
+                ranges.append((end_ms, self.get_duration()))
+            return ranges
         else:
             return self._wav_cut_from_middle(start_ms, end_ms)
     
@@ -88,94 +164,843 @@ class AudioCutter:
         if end_ms > self.get_duration():
             raise ValueError("End time cannot be beyond the audio length")
         
-        if self.backend == 'pydub':
-            return self.audio[start_ms:end_ms]
+        if self.backend in ('av', 'pydub'):
+            return [(start_ms, end_ms)]
         else:
             return self._wav_extract_segment(start_ms, end_ms)
     
     def get_duration(self):
-        if self.backend == 'pydub':
-            return len(self.audio)
-        else:
-            return self.duration_ms
+        return self.duration_ms
+    
+    def as_ndarray(self):
+        # Zero-copy (frames, channels) view of the samples for numeric work
+        if self.backend != 'wave':
+            raise ValueError("as_ndarray() is only available for WAV files")
+        try:
+            import numpy as np
+        except ImportError:
+            raise ValueError("as_ndarray() requires numpy")
+        dtype = {1: np.uint8, 2: '<i2', 4: '<i4'}.get(self.sample_width)
+        if dtype is None:
+            raise ValueError(f"{self.sample_width * 8}-bit samples have no NumPy dtype")
+        self._ensure_mapped()
+        return np.frombuffer(self._data_view, dtype=dtype).reshape(-1, self.channels)
+    
+    def truncate_from_back(self, duration_ms):
+        if self.backend != 'wave':
+            raise ValueError("In-place truncation is only supported for WAV files")
+        if duration_ms <= 0:
+            raise ValueError("Duration must be positive")
+        if duration_ms >= self.get_duration():
+            raise ValueError("Duration cannot be longer than the audio file")
+        
+        cut_frames = self._ms_to_frame(duration_ms)
+        keep_frames = self.total_frames - cut_frames
+        data_size = keep_frames * self._bpf
+        file_size = self.data_offset + data_size
+        
+        # Views of the old mapping would point past the new end of file, and
+        # touching them after the truncate kills the process with SIGBUS
+        if self.mm is not None:
+            try:
+                self._data_view.release()
+                self.mm.close()
+            except BufferError:
+                raise ValueError("Cannot truncate a WAV file while arrays from as_ndarray() are still in use")
+            self.mm = None
+            self._data_view = None
+        try:
+            with open(self.input_file, 'r+b') as f:
+                f.truncate(file_size)
+                f.seek(4)
+                f.write(struct.pack('<I', file_size - 8))
+                f.seek(self.data_offset - 4)
+                f.write(struct.pack('<I', data_size))
+        except OSError as e:
+            raise ValueError(f"Could not truncate WAV file: {e}")
+        
+        self.total_frames = keep_frames
+        self.duration_ms = self.total_frames * 1000 // self.sample_rate
+        return self.input_file
     
     def save_audio(self, audio_data, output_file, format=None):
         output_path = Path(output_file)
         
-        if self.backend == 'pydub':
+        if self.backend == 'av':
             if format is None:
                 format = output_path.suffix[1:].lower() if output_path.suffix else 'mp3'
             try:
-                audio_data.export(str(output_path), format=format)
+                with self._staged_output(output_path) as target:
+                    # Same container: move the compressed packets across
+                    # untouched. Otherwise decode and encode frame by frame.
+                    input_format = self.input_file.suffix[1:].lower()
+                    if format == input_format and input_format not in NO_STREAM_COPY_FORMATS:
+                        self.output_duration_ms = self._av_remux(audio_data, target)
+                    elif _av_can_encode(format) or _try_import_pydub() is None or FFMPEG_PATH is None:
+                        self.output_duration_ms = self._av_transcode(audio_data, target, format)
+                    else:
+                        # e.g. .ogg from a PyAV wheel without libvorbis;
+                        # pydub encodes with the ffmpeg CLI instead
+                        self._export_ranges(audio_data, target, format)
+                        self.output_duration_ms = sum(end_ms - start_ms for start_ms, end_ms in audio_data)
+                return output_path
+            except Exception as e:
+                raise ValueError(f"Could not save audio file: {e}")
+        elif self.backend == 'pydub':
+            if format is None:
+                format = output_path.suffix[1:].lower() if output_path.suffix else 'mp3'
+            try:
+                # pydub results are lists of (start_ms, end_ms) ranges to keep.
+                if self._can_stream_copy(audio_data, format):
+                    with self._staged_output(output_path) as target:
+                        self._ffmpeg_copy_ranges(audio_data, target)
+                else:
+                    self._export_ranges(audio_data, output_path, format)
                 return output_path
             except Exception as e:
                 raise ValueError(f"Could not save audio file: {e}")
         else:
+            # Middle cuts come back as separate pieces so they never have to
+            # be joined in memory
+            pieces = audio_data if isinstance(audio_data, (tuple, list)) else (audio_data,)
+            
+            if format is None:
+                format = output_path.suffix[1:].lower() if output_path.suffix else 'wav'
+            # Checked only for encoded output, so WAV-to-WAV cuts never
+            # import PyAV
+            if format != 'wav' and (_try_import_av() is not None or FFMPEG_PATH is not None):
+                # e.g. a cached decode of an MP3 being saved back to MP3
+                chunks = [self._as_buffer(piece) for piece in pieces]
+                try:
+                    with self._staged_output(output_path) as target:
+                        if _try_import_av() is not None and (_av_can_encode(format) or FFMPEG_PATH is None):
+                            self._av_encode(chunks, target, format)
+                        else:
+                            self._ffmpeg_encode(chunks, target, format)
+                    return output_path
+                except Exception as e:
+                    raise ValueError(f"Could not save audio file: {e}")
+            
             # Save WAV file using wave module
             if not str(output_path).lower().endswith('.wav'):
                 output_path = output_path.with_suffix('.wav')
             
             try:
-                with wave.open(str(output_path), 'wb') as output_wav:
-                    output_wav.setnchannels(self.channels)
-                    output_wav.setsampwidth(self.sample_width)
-                    output_wav.setframerate(self.sample_rate)
-                    output_wav.writeframes(audio_data)
+                with self._staged_output(output_path) as target:
+                    if SENDFILE_TO_FILES and all(isinstance(piece, _SendfileSlice) for piece in pieces):
+                        self._sendfile_wav(pieces, target)
+                    else:
+                        self._write_wav([self._as_buffer(piece) for piece in pieces], target)
                 return output_path
             except Exception as e:
                 raise ValueError(f"Could not save WAV file: {e}")
     
+    def _open_av(self):
+        av = _try_import_av()
+        try:
+            self.container = av.open(str(self.input_file))
+            self.stream = self.container.streams.audio[0]
+        except Exception as e:
+            raise ValueError(f"Could not open audio file with PyAV: {e}")
+        self.time_base = self.stream.time_base
+        # Timestamps count from the stream's start (e.g. after an MP3's
+        # encoder delay) rather than from zero
+        self.start_pts = self.stream.start_time or 0
+        self.sample_rate = self.stream.rate
+        self.channels = self.stream.channels
+        if self.stream.duration is not None:
+            self.duration_ms = int(self.stream.duration * self.time_base * 1000)
+        else:
+            self.duration_ms = self.container.duration * 1000 // av.time_base
+
+    def _av_packets(self, ranges):
+        # Yield the packets covering each range with their timestamps
+        # shifted so the ranges play back to back from zero
+        cursor = 0
+        for start_ms, end_ms in ranges:
+            start_pts = int(Fraction(start_ms, 1000) / self.time_base) + self.start_pts
+            end_pts = None if end_ms is None else int(Fraction(end_ms, 1000) / self.time_base) + self.start_pts
+            self.container.seek(start_pts, stream=self.stream)
+            shift = None
+            for packet in self.container.demux(self.stream):
+                if packet.pts is None:
+                    continue
+                if packet.pts < start_pts:
+                    continue
+                if end_pts is not None and packet.pts >= end_pts:
+                    break
+                if shift is None:
+                    shift = packet.pts - cursor
+                packet.pts -= shift
+                if packet.dts is not None:
+                    packet.dts -= shift
+                cursor = packet.pts + (packet.duration or 0)
+                yield packet
+
+    def _av_decoded(self, start_pts, end_pts):
+        # Decode from the seek point, including the packet that straddles
+        # start_pts, and drain the decoder once the range is passed
+        for packet in self.container.demux(self.stream):
+            if end_pts is not None and packet.pts is not None and packet.pts >= end_pts:
+                break
+            # The demuxer's final empty packet flushes the decoder itself
+            yield from packet.decode()
+        else:
+            return
+        yield from self.stream.codec_context.decode(None)
+
+    def _av_frames(self, ranges):
+        # Unlike the packet copy, decoded ranges are trimmed to the sample
+        samples = 0
+        for start_ms, end_ms in ranges:
+            start = start_ms * self.sample_rate // 1000
+            end = None if end_ms is None else end_ms * self.sample_rate // 1000
+            start_pts = int(Fraction(start_ms, 1000) / self.time_base) + self.start_pts
+            end_pts = None if end_ms is None else int(Fraction(end_ms, 1000) / self.time_base) + self.start_pts
+            self.container.seek(start_pts, stream=self.stream)
+            position = None
+            for frame in self._av_decoded(start_pts, end_pts):
+                if frame.pts is not None:
+                    position = int((frame.pts - self.start_pts) * self.time_base * self.sample_rate)
+                elif position is None:
+                    position = start
+                keep_from = max(start - position, 0)
+                keep_to = frame.samples if end is None else min(end - position, frame.samples)
+                position += frame.samples
+                if keep_to <= keep_from:
+                    continue
+                if keep_to - keep_from != frame.samples:
+                    frame = _slice_av_frame(frame, keep_from, keep_to)
+                frame.pts = samples
+                frame.time_base = Fraction(1, self.sample_rate)
+                samples += frame.samples
+                yield frame
+
+    def _av_remux(self, ranges, out_path):
+        # Returns the output duration in ms, which is rounded to packets
+        av = _try_import_av()
+        end = 0
+        with av.open(str(out_path), 'w', format=_output_muxer(out_path, self.input_file.suffix[1:].lower())) as output:
+            out_stream = output.add_stream_from_template(self.stream)
+            for packet in self._av_packets(ranges):
+                end = packet.pts + (packet.duration or 0)
+                packet.stream = out_stream
+                output.mux(packet)
+        return int(end * self.time_base * 1000)
+
+    def _av_transcode(self, ranges, out_path, format, codec=None):
+        # Returns the output duration in ms
+        av = _try_import_av()
+        samples = 0
+        with av.open(str(out_path), 'w', format=_output_muxer(out_path, format)) as output:
+            # WAV output keeps a lossless source's bit depth, float included,
+            # rather than the muxer's default 16-bit PCM
+            if codec is None and format == 'wav':
+                pcm_codec = _integer_pcm_codec if self.stream.codec_context.codec.lossy else _pcm_codec_for
+                codec = pcm_codec(self.stream.format.name)
+            elif codec is None:
+                codec = _av_codec_for(output, format)
+            rate = _encoder_rate(codec, self.sample_rate)
+            out_stream = output.add_stream(codec, rate=rate)
+            out_stream.layout = self.stream.layout
+            _keep_sample_format(out_stream, self.stream.format.name)
+            frames = self._av_frames(ranges)
+            if rate != self.sample_rate:
+                frames = _resampled(frames, rate)
+            # The encoder converts to its own sample format and frame size
+            for frame in frames:
+                samples += frame.samples
+                output.mux(out_stream.encode(frame))
+            output.mux(out_stream.encode(None))
+        return samples * 1000 // rate
+
+    def _probe_stream_info(self):
+        if FFPROBE_PATH is None:
+            return False
+        command = [FFPROBE_PATH, "-v", "error", "-select_streams", "a:0",
+                   "-show_entries", "stream=sample_rate,channels:format=duration",
+                   "-of", "default=nw=1", str(self.input_file)]
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise ValueError(f"Could not probe audio file: {result.stderr.strip()}")
+
+        info = dict(line.split('=', 1) for line in result.stdout.splitlines() if '=' in line)
+        try:
+            self.sample_rate = int(info['sample_rate'])
+            self.channels = int(info['channels'])
+            self.duration_ms = int(round(float(info['duration']) * 1000))
+        except (KeyError, ValueError):
+            # Missing or N/A fields (e.g. raw streams without a duration)
+            return False
+        return True
+
+    def _ensure_loaded(self):
+        if self.audio is None:
+            try:
+                self.audio = _try_import_pydub().AudioSegment.from_file(str(self.input_file))
+            except Exception as e:
+                raise ValueError(f"Could not load audio file with pydub: {e}")
+        return self.audio
+
+    def _can_stream_copy(self, ranges, format):
+        # When the container is unchanged, ffmpeg can copy the compressed
+        # packets instead of decoding and re-encoding the audio
+        input_format = self.input_file.suffix[1:].lower()
+        return (FFMPEG_PATH is not None and bool(ranges)
+                and format == input_format and input_format not in NO_STREAM_COPY_FORMATS)
+
+    def _export_ranges(self, ranges, output_path, format):
+        audio = self._ensure_loaded()
+        # Encoded formats already go through an ffmpeg pass over the whole
+        # decoded segment, so a single range can be trimmed there instead of
+        # being copied out of the PCM buffer first. WAV and raw are written
+        # by pydub directly and are cheaper to slice.
+        if len(ranges) == 1 and FFMPEG_PATH is not None and format not in ('wav', 'raw'):
+            start_ms, end_ms = ranges[0]
+            parameters = []
+            if start_ms > 0:
+                parameters += ["-ss", f"{start_ms / 1000:.3f}"]
+            if end_ms < len(audio):
+                parameters += ["-t", f"{(end_ms - start_ms) / 1000:.3f}"]
+            audio.export(str(output_path), format=format, parameters=parameters or None)
+        else:
+            self._render_ranges(ranges).export(str(output_path), format=format)
+
+    def _render_ranges(self, ranges):
+        # Slice the decoded PCM directly and spawn a single segment from it;
+        # slicing and adding AudioSegments would copy every piece twice.
+        audio = self._ensure_loaded()
+        raw = memoryview(audio.raw_data)
+        frame_rate = audio.frame_rate
+        frame_width = audio.frame_width
+        pieces = []
+        for start_ms, end_ms in ranges:
+            start = (start_ms * frame_rate // 1000) * frame_width
+            end = (end_ms * frame_rate // 1000) * frame_width
+            pieces.append(raw[start:end])
+        return audio._spawn(b''.join(pieces))
+
+    def _is_input_file(self, path):
+        return Path(path).exists() and os.path.samefile(path, self.input_file)
+
+    @contextlib.contextmanager
+    def _staged_output(self, output_path):
+        # Writing straight over the input would truncate it while it is still
+        # being read, so stage the result next to it and swap it in afterwards.
+        if not self._is_input_file(output_path):
+            yield output_path
+            return
+        fd, temp_name = tempfile.mkstemp(suffix=output_path.suffix, dir=output_path.parent)
+        os.close(fd)
+        try:
+            yield Path(temp_name)
+            shutil.copymode(output_path, temp_name)
+            os.replace(temp_name, output_path)
+        except BaseException:
+            os.unlink(temp_name)
+            raise
+
+    def _ffmpeg_stream_copy(self, start_ms, end_ms, out_path):
+        command = [FFMPEG_PATH, "-y", "-hide_banner", "-loglevel", "error"]
+        if start_ms > 0:
+            command += ["-ss", f"{start_ms / 1000:.3f}"]
+        command += ["-i", str(self.input_file)]
+        if end_ms is not None:
+            command += ["-t", f"{(end_ms - start_ms) / 1000:.3f}"]
+        command += ["-map", "0:a", "-c", "copy", str(out_path)]
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise ValueError(f"ffmpeg failed: {result.stderr.strip()}")
+
+    def _ffmpeg_copy_ranges(self, ranges, out_path):
+        duration = self.get_duration()
+        if len(ranges) == 1:
+            start_ms, end_ms = ranges[0]
+            self._ffmpeg_stream_copy(start_ms, None if end_ms >= duration else end_ms, out_path)
+            return
+
+        # Copy each kept range to its own file, then join them with the
+        # concat demuxer, which also stream-copies.
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_dir = Path(temp_dir)
+            list_lines = []
+            for index, (start_ms, end_ms) in enumerate(ranges):
+                part_path = temp_dir / f"part{index}{self.input_file.suffix}"
+                self._ffmpeg_stream_copy(start_ms, None if end_ms >= duration else end_ms, part_path)
+                escaped = str(part_path).replace("'", "'\\''")
+                list_lines.append(f"file '{escaped}'\n")
+            list_path = temp_dir / "list.txt"
+            list_path.write_text("".join(list_lines))
+
+            command = [FFMPEG_PATH, "-y", "-hide_banner", "-loglevel", "error",
+                       "-f", "concat", "-safe", "0", "-i", str(list_path),
+                       "-c", "copy", str(out_path)]
+            result = subprocess.run(command, capture_output=True, text=True)
+            if result.returncode != 0:
+                raise ValueError(f"ffmpeg failed: {result.stderr.strip()}")
+
+    def _av_encode(self, chunks, out_path, format):
+        # FFmpeg has no packed 24-bit sample format, so those samples are
+        # widened to 32 bits on the way in
+        sample_format = {1: 'u8', 2: 's16', 3: 's32', 4: 's32'}[self.sample_width]
+        av = _try_import_av()
+        with av.open(str(out_path), 'w', format=_output_muxer(out_path, format)) as output:
+            codec = _av_codec_for(output, format)
+            rate = _encoder_rate(codec, self.sample_rate)
+            out_stream = output.add_stream(codec, rate=rate)
+            out_stream.layout = {1: 'mono', 2: 'stereo'}.get(self.channels, f"{self.channels}c")
+            _keep_sample_format(out_stream, sample_format)
+            frames = self._pcm_frames(chunks, sample_format, out_stream.layout)
+            if rate != self.sample_rate:
+                frames = _resampled(frames, rate)
+            for frame in frames:
+                output.mux(out_stream.encode(frame))
+            output.mux(out_stream.encode(None))
+
+    def _pcm_frames(self, chunks, sample_format, layout):
+        # Feed the encoder in blocks so no frame spans a whole chunk
+        av = _try_import_av()
+        block_size = 4096 * self._bpf
+        samples = 0
+        for chunk in chunks:
+            for offset in range(0, chunk.nbytes, block_size):
+                block = chunk[offset:offset + block_size]
+                frame = av.AudioFrame(format=sample_format, layout=layout,
+                                      samples=block.nbytes // self._bpf)
+                if self.sample_width == 3:
+                    block = _widen_s24(block)
+                frame.planes[0].update(block)
+                frame.sample_rate = self.sample_rate
+                frame.pts = samples
+                frame.time_base = Fraction(1, self.sample_rate)
+                samples += frame.samples
+                yield frame
+
+    def _ffmpeg_encode(self, chunks, out_path, format):
+        sample_format = {1: 'u8', 2: 's16le', 3: 's24le', 4: 's32le'}[self.sample_width]
+        command = [FFMPEG_PATH, "-y", "-hide_banner", "-loglevel", "error",
+                   "-f", sample_format, "-ar", str(self.sample_rate), "-ac", str(self.channels),
+                   "-i", "pipe:0"]
+        muxer = _output_muxer(out_path, format)
+        if muxer is not None:
+            command += ["-f", muxer]
+        command.append(str(out_path))
+        
+        process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            for chunk in chunks:
+                process.stdin.write(chunk)
+        except BrokenPipeError:
+            # ffmpeg exited early; its error message is reported below
+            pass
+        finally:
+            process.stdin.close()
+        error = process.stderr.read().decode(errors='replace').strip()
+        if process.wait() != 0:
+            raise ValueError(f"ffmpeg failed: {error}")
+
+    def _write_wav(self, chunks, out_path):
+        with open(out_path, 'wb', buffering=0) as raw, \
+                io.BufferedWriter(raw, buffer_size=OUTPUT_BUFFER_SIZE) as buffered, \
+                wave.open(buffered, 'wb') as output_wav:
+            _preallocate(raw, WAV_HEADER_SIZE + sum(chunk.nbytes for chunk in chunks))
+            output_wav.setnchannels(self.channels)
+            output_wav.setsampwidth(self.sample_width)
+            output_wav.setframerate(self.sample_rate)
+            for chunk in chunks:
+                output_wav.writeframes(chunk)
+
+    def _sendfile_wav(self, slices, out_path):
+        # Write the header ourselves, then have the kernel copy the sample
+        # bytes straight from the input file; they never enter user space
+        data_size = sum(piece.nbytes for piece in slices)
+        header = struct.pack('<4sI4s4sIHHIIHH4sI',
+                             b'RIFF', WAV_HEADER_SIZE - 8 + data_size, b'WAVE',
+                             b'fmt ', 16, WAVE_FORMAT_PCM, self.channels, self.sample_rate,
+                             self.sample_rate * self._bpf, self._bpf, self.sample_width * 8,
+                             b'data', data_size)
+        with open(self.input_file, 'rb') as source, open(out_path, 'wb', buffering=0) as output:
+            _preallocate(output, len(header) + data_size)
+            output.write(header)
+            for piece in slices:
+                offset, remaining = piece.offset, piece.nbytes
+                while remaining:
+                    sent = os.sendfile(output.fileno(), source.fileno(), offset, remaining)
+                    if sent == 0:
+                        raise ValueError("WAV file ended before the requested frames")
+                    offset += sent
+                    remaining -= sent
+
+    def _as_buffer(self, piece):
+        if isinstance(piece, _SendfileSlice):
+            self._ensure_mapped()
+            start = piece.offset - self.data_offset
+            return self._data_view[start:start + piece.nbytes]
+        if hasattr(piece, 'ndim'):
+            # The header is written from this file's parameters, so arrays
+            # must keep the (frames, channels) shape and sample size
+            if piece.ndim != 2 or piece.shape[1] != self.channels or piece.itemsize != self.sample_width:
+                raise ValueError(f"Expected a (frames, {self.channels}) array of {self.sample_width}-byte "
+                                 f"samples, got shape {piece.shape} of {piece.itemsize}-byte samples")
+        return _as_byte_view(piece)
+
+    def _ms_to_frame(self, ms):
+        # Integer math keeps frame boundaries exact for any duration
+        return (ms * self.sample_rate) // 1000
+
+    def _ensure_mapped(self):
+        # Map the file so cuts are memoryview slices of the page cache
+        # rather than readframes() copies
+        if self.mm is None:
+            fd = os.open(self.input_file, os.O_RDONLY)
+            try:
+                self.mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            finally:
+                os.close(fd)
+            # A view of just the sample data, so each cut is one slice
+            data_end = self.data_offset + self.total_frames * self._bpf
+            self._data_view = memoryview(self.mm)[self.data_offset:data_end]
+        return self.mm
+
+    def _wav_frames(self, start_frame, end_frame):
+        bpf = self._bpf
+        return _SendfileSlice(self.data_offset + start_frame * bpf, (end_frame - start_frame) * bpf)
+
     def _wav_cut_from_front(self, duration_ms):
-        start_frame = int((duration_ms / 1000) * self.sample_rate)
-        self.wave_file.setpos(start_frame)
-        remaining_frames = self.total_frames - start_frame
-        return self.wave_file.readframes(remaining_frames)
+        start_frame = self._ms_to_frame(duration_ms)
+        return self._wav_frames(start_frame, self.total_frames)
     
     def _wav_cut_from_back(self, duration_ms):
-        cut_frames = int((duration_ms / 1000) * self.sample_rate)
+        cut_frames = self._ms_to_frame(duration_ms)
         keep_frames = self.total_frames - cut_frames
-        self.wave_file.setpos(0)
-        return self.wave_file.readframes(keep_frames)
+        return self._wav_frames(0, keep_frames)
     
     def _wav_cut_from_middle(self, start_ms, end_ms):
-        start_frame = int((start_ms / 1000) * self.sample_rate)
-        end_frame = int((end_ms / 1000) * self.sample_rate)
+        start_frame = self._ms_to_frame(start_ms)
+        end_frame = self._ms_to_frame(end_ms)
         
-        # Get the part before the cut
-        self.wave_file.setpos(0)
-        before_data = self.wave_file.readframes(start_frame)
+        before_data = self._wav_frames(0, start_frame)
+        after_data = self._wav_frames(end_frame, self.total_frames)
         
-        # Get the part after the cut
-        self.wave_file.setpos(end_frame)
-        after_data = self.wave_file.readframes(self.total_frames - end_frame)
-        
-        return before_data + after_data
+        return (before_data, after_data)
     
     def _wav_extract_segment(self, start_ms, end_ms):
-        start_frame = int((start_ms / 1000) * self.sample_rate)
-        end_frame = int((end_ms / 1000) * self.sample_rate)
+        start_frame = self._ms_to_frame(start_ms)
+        end_frame = self._ms_to_frame(end_ms)
         
-        self.wave_file.setpos(start_frame)
-        return self.wave_file.readframes(end_frame - start_frame)
+        return self._wav_frames(start_frame, end_frame)
 
 
-def parse_time(time_str):
-    if time_str.endswith('s'):
-        return int(float(time_str[:-1]) * 1000)
-    elif time_str.endswith('ms'):
-        return int(time_str[:-2])
-    elif time_str.endswith('m'):
-        return int(float(time_str[:-1]) * 60 * 1000)
-    elif ':' in time_str:
-        parts = time_str.split(':')
-        if len(parts) == 2:
-            minutes, seconds = parts
-            return int(float(minutes) * 60 * 1000 + float(seconds) * 1000)
-        elif len(parts) == 3:
-            hours, minutes, seconds = parts
-            return int(float(hours) * 3600 * 1000 + float(minutes) * 60 * 1000 + float(seconds) * 1000)
+def _cached_wav(path, cache_dir, cache_limit):
+    # Cache entries are keyed by the source's identity, so an edited file
+    # gets a fresh decode
+    stat = path.stat()
+    key = hashlib.blake2b(f"{os.path.realpath(path)}:{stat.st_mtime_ns}:{stat.st_size}".encode()).hexdigest()[:16]
+    cached = cache_dir / f"{key}.wav"
+    # A cache path that is a file or cannot be written is a usage error,
+    # not a crash
+    try:
+        if cached.exists():
+            # Refresh the mtime, which the eviction pass treats as last use
+            os.utime(cached)
+            return cached
+        
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Decode next to the final name and rename into place, so concurrent
+        # runs never see a half-written entry
+        partial = cache_dir / f"{key}.{os.getpid()}.partial"
+        try:
+            _decode_to_wav(path, partial)
+            os.replace(partial, cached)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                partial.unlink()
+            raise
+        _evict_cache(cache_dir, cache_limit, keep=cached)
+        return cached
+    except OSError as e:
+        raise ValueError(f"Could not use cache directory {cache_dir}: {e}")
+
+
+def _decode_to_wav(source, target):
+    if FFMPEG_PATH is not None:
+        command = [FFMPEG_PATH, "-y", "-hide_banner", "-loglevel", "error",
+                   "-i", str(source), "-map", "0:a:0"]
+        # ffmpeg's WAV muxer would otherwise write 16-bit PCM whatever the
+        # source's depth
+        codec = _probe_pcm_codec(source)
+        if codec is not None:
+            command += ["-c:a", codec]
+        command += ["-f", "wav", str(target)]
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise ValueError(f"Could not decode {source}: {result.stderr.strip()}")
+    elif _try_import_av() is not None:
+        cutter = AudioCutter(source)
+        try:
+            cutter._av_transcode([(0, None)], target, 'wav', _integer_pcm_codec(cutter.stream.format.name))
+        except Exception as e:
+            raise ValueError(f"Could not decode {source}: {e}")
     else:
-        return int(float(time_str) * 1000)
+        raise ValueError("--cache-dir needs ffmpeg or PyAV to decode non-WAV files")
+
+
+def _probe_pcm_codec(source):
+    if FFPROBE_PATH is None:
+        return None
+    result = subprocess.run([FFPROBE_PATH, "-v", "error", "-select_streams", "a:0",
+                             "-show_entries", "stream=sample_fmt,bits_per_raw_sample",
+                             "-of", "default=nw=1", str(source)],
+                            capture_output=True, text=True)
+    info = dict(line.split('=', 1) for line in result.stdout.splitlines() if '=' in line)
+    if 'sample_fmt' not in info:
+        return None
+    bits = int(info['bits_per_raw_sample']) if info.get('bits_per_raw_sample', '').isdigit() else None
+    return _integer_pcm_codec(info['sample_fmt'], bits)
+
+
+def _pcm_codec_for(sample_format, bits=None):
+    # PCM codec that holds a decoder's samples without losing precision
+    sample_format = sample_format.rstrip('p')
+    if sample_format == 's32':
+        return 'pcm_s24le' if bits == 24 else 'pcm_s32le'
+    return {'u8': 'pcm_u8', 'flt': 'pcm_f32le', 'dbl': 'pcm_f64le'}.get(sample_format, 'pcm_s16le')
+
+
+def _integer_pcm_codec(sample_format, bits=None):
+    # For lossy decoders, whose float output is kept at 16 bits as pydub
+    # decodes it, and for cached decodes, which the wave backend reads
+    codec = _pcm_codec_for(sample_format, bits)
+    return 'pcm_s16le' if codec in ('pcm_f32le', 'pcm_f64le') else codec
+
+
+def _evict_cache(cache_dir, cache_limit, keep):
+    # Drop the least recently used entries until the cache fits its limit
+    entries = []
+    for entry in cache_dir.glob('*.wav'):
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            # Already evicted by a concurrent run
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry))
+    
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries):
+        if total <= cache_limit:
+            break
+        if entry == keep:
+            continue
+        with contextlib.suppress(FileNotFoundError):
+            entry.unlink()
+        total -= size
+
+
+def _probe_duration_ms(path):
+    # Cheapest available way to learn a file's duration, or None if nothing
+    # can read it without a full AudioCutter
+    if not Path(path).exists():
+        raise FileNotFoundError(f"Audio file not found: {path}")
+
+    if str(path).lower().endswith('.wav'):
+        try:
+            sample_rate, _, _, num_frames, _ = _probe_wav_header(path)
+            return num_frames * 1000 // sample_rate
+        except ValueError:
+            pass
+
+    try:
+        from mutagen import File as MutagenFile
+        metadata = MutagenFile(path)
+        if metadata is not None and metadata.info.length:
+            return int(metadata.info.length * 1000)
+    except Exception:
+        # mutagen missing, or it cannot parse this file
+        pass
+
+    if FFPROBE_PATH is not None:
+        result = subprocess.run([FFPROBE_PATH, "-v", "error", "-show_entries", "format=duration",
+                                 "-of", "default=nw=1:nk=1", str(path)],
+                                capture_output=True, text=True)
+        try:
+            return int(round(float(result.stdout.strip()) * 1000))
+        except ValueError:
+            pass
+
+    return None
+
+
+def _av_codec_for(output, format):
+    # Use pydub's choice where it differs from the muxer's default. If this
+    # FFmpeg build lacks it, fail rather than quietly writing another codec
+    # (e.g. FLAC in an .ogg file).
+    codec = AV_DEFAULT_CODECS.get(format)
+    if codec is None:
+        return output.default_audio_codec
+    if codec not in _try_import_av().codecs_available:
+        raise ValueError(f"This PyAV build has no {codec} encoder for {format} output; "
+                         "install FFmpeg and pydub to write it")
+    return codec
+
+
+def _av_can_encode(format):
+    codec = AV_DEFAULT_CODECS.get(format)
+    return codec is None or codec in _try_import_av().codecs_available
+
+
+def _output_muxer(out_path, format):
+    # Let FFmpeg pick the muxer from the extension when it agrees with the
+    # requested format, since extensions like .m4a map to differently named
+    # muxers; None means "guess from the path"
+    return None if Path(out_path).suffix[1:].lower() == format else format
+
+
+def _as_byte_view(chunk):
+    # Flat byte view of bytes, memoryviews or arrays from as_ndarray();
+    # only non-contiguous arrays (e.g. every other frame) need a copy
+    view = memoryview(chunk)
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes())
+    return view.cast('B')
+
+
+def _encoder_rate(codec, rate):
+    # The source's rate if the encoder takes it (e.g. libopus only takes
+    # 48 kHz and below, libmp3lame nothing above 48 kHz), else the nearest
+    # supported rate above it, else the highest one
+    rates = _try_import_av().Codec(codec, 'w').audio_rates
+    if not rates or rate in rates:
+        return rate
+    higher = [supported for supported in rates if supported > rate]
+    return min(higher) if higher else max(rates)
+
+
+def _resampled(frames, rate):
+    resampler = _try_import_av().AudioResampler(rate=rate)
+    for frame in frames:
+        yield from resampler.resample(frame)
+    # Flush the samples the resampler still holds
+    yield from resampler.resample(None)
+
+
+def _keep_sample_format(out_stream, sample_format):
+    # PyAV encoders default to their first sample format (s16 for FLAC), so
+    # ask for the source's own when the encoder can take it
+    formats = out_stream.codec_context.codec.audio_formats or ()
+    if any(supported.name == sample_format for supported in formats):
+        out_stream.format = sample_format
+
+
+def _widen_s24(block):
+    # Little-endian 24-bit samples to 32-bit ones with a zero low byte
+    packed = bytes(block)
+    widened = bytearray(len(packed) // 3 * 4)
+    for byte in range(3):
+        widened[byte + 1::4] = packed[byte::3]
+    return widened
+
+
+def _slice_av_frame(frame, start, end):
+    # Copy samples [start, end) of a decoded frame into a new frame
+    av = _try_import_av()
+    array = frame.to_ndarray()
+    if not frame.format.is_planar:
+        # Packed samples are interleaved along a single row
+        channels = len(frame.layout.channels)
+        start, end = start * channels, end * channels
+    sliced = av.AudioFrame.from_ndarray(array[:, start:end].copy(), format=frame.format.name,
+                                        layout=frame.layout.name)
+    sliced.sample_rate = frame.sample_rate
+    return sliced
+
+
+def _preallocate(raw_file, size):
+    # Reserve the output's blocks up front so the filesystem can lay the
+    # file out contiguously; purely an optimisation, so failures are ignored.
+    if hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(raw_file.fileno(), 0, size)
+        except OSError:
+            pass
+
+
+class _SendfileSlice:
+    # A byte range of the input WAV. save_audio copies it to the output with
+    # os.sendfile where it can, and through the memory map otherwise.
+    __slots__ = ('offset', 'nbytes')
+
+    def __init__(self, offset, nbytes):
+        self.offset = offset
+        self.nbytes = nbytes
+
+
+def _probe_wav_header(path):
+    # Parse the RIFF header directly: one small read, and no file handle is
+    # kept open. Returns (sample_rate, channels, sample_width, num_frames,
+    # data_offset).
+    with open(path, 'rb') as f:
+        header = f.read(4096)
+        file_size = os.fstat(f.fileno()).st_size
+
+        def read_at(offset, size):
+            if offset + size <= len(header):
+                return header[offset:offset + size]
+            # Only reached when large chunks (e.g. embedded metadata) push
+            # the data chunk past the first read
+            f.seek(offset)
+            data = f.read(size)
+            if len(data) != size:
+                raise ValueError("WAV header is truncated")
+            return data
+
+        if header[:4] != b'RIFF' or header[8:12] != b'WAVE':
+            raise ValueError("Not a RIFF/WAVE file")
+
+        fmt = None
+        offset = 12
+        while offset + 8 <= file_size:
+            chunk_id, chunk_size = struct.unpack('<4sI', read_at(offset, 8))
+            if chunk_id == b'fmt ':
+                format_tag, channels, sample_rate, _, _, bits = struct.unpack('<HHIIHH', read_at(offset + 8, 16))
+                if format_tag == WAVE_FORMAT_EXTENSIBLE:
+                    # The real format is the first two bytes of the
+                    # SubFormat GUID in the extended part of the chunk
+                    if chunk_size < 40:
+                        raise ValueError("WAV extensible fmt chunk is truncated")
+                    format_tag, = struct.unpack('<H', read_at(offset + 8 + 24, 2))
+                if format_tag != WAVE_FORMAT_PCM:
+                    raise ValueError(f"Unsupported WAV format: {format_tag}")
+                if not (channels and sample_rate and bits):
+                    raise ValueError("WAV fmt chunk has a zero channel count, sample rate or bit depth")
+                fmt = (sample_rate, channels, (bits + 7) // 8)
+            elif chunk_id == b'data':
+                if fmt is None:
+                    raise ValueError("WAV data chunk precedes its fmt chunk")
+                sample_rate, channels, sample_width = fmt
+                data_offset = offset + 8
+                # Streamed WAVs may leave the size unset; clamp to the file
+                data_size = min(chunk_size, file_size - data_offset)
+                return sample_rate, channels, sample_width, data_size // (channels * sample_width), data_offset
+            # Chunks are padded to an even length
+            offset += 8 + chunk_size + (chunk_size & 1)
+    raise ValueError("WAV file has no data chunk")
+
+
+_NUMBER = r'(\d+(?:\.\d*)?|\.\d+)'
+# Either [[H:]M:]S clock notation, or a bare number with an optional unit
+_TIME_RE = re.compile(rf'^(?:(?:{_NUMBER}:)?{_NUMBER}:{_NUMBER}|{_NUMBER}(ms|s|m)?)$')
+_UNIT_MS = {'ms': 1, 's': 1000, 'm': 60 * 1000, None: 1000}
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_time(time_str):
+    match = _TIME_RE.match(time_str)
+    if match is None:
+        raise ValueError(f"Invalid time format: {time_str}")
+    hours, minutes, seconds, value, unit = match.groups()
+    if value is not None:
+        return int(float(value) * _UNIT_MS[unit])
+    return int(float(hours or 0) * 3600 * 1000 + float(minutes) * 60 * 1000 + float(seconds) * 1000)
 
 
 def format_duration(duration_ms):
@@ -190,6 +1015,153 @@ def format_duration(duration_ms):
         return f"{minutes:02d}:{seconds:06.3f}"
 
 
+OPERATIONS = {'cut-front': 1, 'cut-back': 1, 'cut-middle': 2, 'extract': 2}
+
+
+def process_file(input_file, operation, times, output_file, format=None, show_info=False,
+                 cache_dir=None, cache_limit=DEFAULT_CACHE_LIMIT):
+    # Information only: read the duration from the header and never open
+    # the file for decoding
+    if operation is None:
+        duration = _probe_duration_ms(input_file)
+        if duration is not None:
+            print(f"Audio duration: {format_duration(duration)} ({duration} ms)")
+            return None
+    
+    cutter = AudioCutter(input_file, cache_dir, cache_limit)
+    
+    if show_info or operation is None:
+        duration = cutter.get_duration()
+        print(f"Audio duration: {format_duration(duration)} ({duration} ms)")
+    
+    if operation is None:
+        return None
+    
+    if operation == 'cut-front':
+        duration_ms = parse_time(times[0])
+        result_audio = cutter.cut_from_front(duration_ms)
+        print(f"Cutting {format_duration(duration_ms)} from front")
+        
+    elif operation == 'cut-back':
+        duration_ms = parse_time(times[0])
+        if cutter.backend == 'wave' and format in (None, 'wav') and cutter._is_input_file(output_file):
+            # Nothing needs copying when a WAV's own tail is dropped
+            cutter.truncate_from_back(duration_ms)
+            result_audio = None
+        else:
+            result_audio = cutter.cut_from_back(duration_ms)
+        print(f"Cutting {format_duration(duration_ms)} from back")
+        
+    elif operation == 'cut-middle':
+        start_ms = parse_time(times[0])
+        end_ms = parse_time(times[1])
+        result_audio = cutter.cut_from_middle(start_ms, end_ms)
+        print(f"Cutting section from {format_duration(start_ms)} to {format_duration(end_ms)}")
+        
+    elif operation == 'extract':
+        start_ms = parse_time(times[0])
+        end_ms = parse_time(times[1])
+        result_audio = cutter.extract_segment(start_ms, end_ms)
+        print(f"Extracting section from {format_duration(start_ms)} to {format_duration(end_ms)}")
+    
+    else:
+        raise ValueError(f"Unknown operation: {operation}")
+    
+    if result_audio is None:
+        output_path = cutter.input_file
+    else:
+        output_path = cutter.save_audio(result_audio, output_file, format)
+    print(f"Saved to: {output_path}")
+    
+    # Calculate output duration correctly based on backend
+    if result_audio is None:
+        output_duration_ms = cutter.get_duration()
+    elif cutter.backend == 'av':
+        # What was actually written, which for packet copies is rounded to
+        # whole packets
+        output_duration_ms = cutter.output_duration_ms
+    elif cutter.backend == 'pydub':
+        output_duration_ms = sum(end_ms - start_ms for start_ms, end_ms in result_audio)
+    elif format in (None, 'wav') and output_path.suffix.lower() == '.wav':
+        # Read it off the file just written, whose header is always the
+        # canonical PCM one, rather than from the audio data
+        data_length = os.path.getsize(output_path) - WAV_HEADER_SIZE
+        output_duration_ms = (data_length // cutter._bpf) * 1000 // cutter.sample_rate
+    else:
+        # Encoded from WAV frames (e.g. a --cache-dir copy); the slices
+        # record how many bytes went to the encoder
+        pieces = result_audio if isinstance(result_audio, (tuple, list)) else (result_audio,)
+        data_length = sum(piece.nbytes for piece in pieces)
+        output_duration_ms = (data_length // cutter._bpf) * 1000 // cutter.sample_rate
+    
+    print(f"Output duration: {format_duration(output_duration_ms)} ({output_duration_ms} ms)")
+    return output_path
+
+
+def read_manifest(manifest_path):
+    # One job per line: input, operation, times and output separated by
+    # tabs, with the operation's times separated by spaces. Blank lines and
+    # lines starting with '#' are skipped.
+    jobs = []
+    with open(manifest_path, newline='') as manifest:
+        for line_number, line in enumerate(manifest, 1):
+            line = line.rstrip('\r\n')
+            if not line.strip() or line.lstrip().startswith('#'):
+                continue
+            fields = line.split('\t')
+            if len(fields) != 4:
+                raise ValueError(f"{manifest_path}:{line_number}: expected 4 tab-separated columns "
+                                 "(input, operation, times, output)")
+            input_file, operation, times, output_file = fields
+            times = tuple(times.split())
+            if operation not in OPERATIONS:
+                raise ValueError(f"{manifest_path}:{line_number}: unknown operation '{operation}'")
+            if len(times) != OPERATIONS[operation]:
+                raise ValueError(f"{manifest_path}:{line_number}: '{operation}' takes {OPERATIONS[operation]} time(s)")
+            jobs.append((input_file, operation, times, output_file))
+    return jobs
+
+
+def _prewarm():
+    # Worker initializer: do the imports and per-process setup once instead
+    # of on each worker's first job
+    _try_import_av()
+    pydub = _try_import_pydub()
+    if pydub is not None and FFMPEG_PATH:
+        pydub.AudioSegment.converter = FFMPEG_PATH
+
+
+def _run_job(job, **options):
+    # Runs in a worker process; output is captured so the parent can print
+    # each job's report in manifest order
+    input_file, operation, times, output_file = job
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            process_file(input_file, operation, times, output_file, **options)
+        return True, output.getvalue()
+    except (OSError, ValueError) as e:
+        # Anything else raised here would abort the whole batch in the parent
+        return False, output.getvalue() + f"Error: {e}\n"
+
+
+def run_batch(manifest_path, **options):
+    jobs = read_manifest(manifest_path)
+    workers = os.cpu_count() or 1
+    # Hand out several jobs per round trip when there are many small files
+    chunksize = max(1, len(jobs) // (workers * 4))
+    
+    failures = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_prewarm) as executor:
+        results = executor.map(functools.partial(_run_job, **options), jobs, chunksize=chunksize)
+        for (input_file, operation, _, _), (ok, report) in zip(jobs, results):
+            print(f"[{input_file}] {operation}")
+            print(report, end='', file=sys.stdout if ok else sys.stderr)
+            if not ok:
+                failures += 1
+    return failures, len(jobs)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Cut audio files by removing sections from front, back, or middle",
@@ -215,14 +1187,17 @@ Usage examples:
   
   # Extract only the middle section from 1:00 to 2:30
   python audio_cutter.py input.mp3 --extract 1:00 2:30 -o output.mp3
+  
+  # Run many cuts in parallel from a tab-separated manifest
+  python audio_cutter.py --batch jobs.tsv
         """
     )
     
-    parser.add_argument("input_file", help="Input audio file")
-    parser.add_argument("-o", "--output", required=True, help="Output audio file")
+    parser.add_argument("input_file", nargs="?", help="Input audio file")
+    parser.add_argument("-o", "--output", help="Output audio file (required when cutting)")
     
     # Cutting operations (mutually exclusive)
-    cut_group = parser.add_mutually_exclusive_group(required=True)
+    cut_group = parser.add_mutually_exclusive_group()
     cut_group.add_argument("--cut-front", metavar="DURATION", 
                           help="Remove specified duration from the front")
     cut_group.add_argument("--cut-back", metavar="DURATION",
@@ -234,51 +1209,49 @@ Usage examples:
     
     parser.add_argument("--format", help="Output format (mp3, wav, etc.). Auto-detected from extension if not specified")
     parser.add_argument("--info", action="store_true", help="Show audio file information")
+    parser.add_argument("--batch", metavar="MANIFEST",
+                        help="Run the jobs listed in a tab-separated manifest in parallel "
+                             "(columns: input, operation, times, output)")
+    parser.add_argument("--cache-dir", metavar="DIR",
+                        help="Keep decoded WAV copies of non-WAV inputs here so repeated cuts skip decoding")
+    parser.add_argument("--cache-size", metavar="MB", type=int, default=DEFAULT_CACHE_LIMIT // (1024 * 1024),
+                        help="Maximum total size of --cache-dir before least recently used entries are removed "
+                             "(default: %(default)s)")
     
     args = parser.parse_args()
+    has_operation = any((args.cut_front, args.cut_back, args.cut_middle, args.extract))
+    if args.batch:
+        if args.input_file or args.output or has_operation:
+            parser.error("--batch cannot be combined with an input file, -o or cut options")
+    elif not args.input_file:
+        parser.error("the following arguments are required: input_file")
+    elif not has_operation and not args.info:
+        parser.error("one of the arguments --cut-front --cut-back --cut-middle --extract --info is required")
+    elif has_operation and not args.output:
+        parser.error("the following arguments are required: -o/--output")
     
+    options = {'format': args.format, 'show_info': args.info, 'cache_dir': args.cache_dir,
+               'cache_limit': args.cache_size * 1024 * 1024}
     try:
-        cutter = AudioCutter(args.input_file)
-        
-        if args.info:
-            duration = cutter.get_duration()
-            print(f"Audio duration: {format_duration(duration)} ({duration} ms)")
+        if args.batch:
+            failures, total = run_batch(args.batch, **options)
+            if failures:
+                print(f"{failures} of {total} jobs failed", file=sys.stderr)
+                sys.exit(1)
+            return
         
         if args.cut_front:
-            duration_ms = parse_time(args.cut_front)
-            result_audio = cutter.cut_from_front(duration_ms)
-            print(f"Cutting {format_duration(duration_ms)} from front")
-            
+            operation, times = 'cut-front', (args.cut_front,)
         elif args.cut_back:
-            duration_ms = parse_time(args.cut_back)
-            result_audio = cutter.cut_from_back(duration_ms)
-            print(f"Cutting {format_duration(duration_ms)} from back")
-            
+            operation, times = 'cut-back', (args.cut_back,)
         elif args.cut_middle:
-            start_ms = parse_time(args.cut_middle[0])
-            end_ms = parse_time(args.cut_middle[1])
-            result_audio = cutter.cut_from_middle(start_ms, end_ms)
-            print(f"Cutting section from {format_duration(start_ms)} to {format_duration(end_ms)}")
-            
+            operation, times = 'cut-middle', tuple(args.cut_middle)
         elif args.extract:
-            start_ms = parse_time(args.extract[0])
-            end_ms = parse_time(args.extract[1])
-            result_audio = cutter.extract_segment(start_ms, end_ms)
-            print(f"Extracting section from {format_duration(start_ms)} to {format_duration(end_ms)}")
-        
-        output_path = cutter.save_audio(result_audio, args.output, args.format)
-        print(f"Saved to: {output_path}")
-        
-        # Calculate output duration correctly based on backend
-        if cutter.backend == 'pydub':
-            output_duration_ms = len(result_audio)
+            operation, times = 'extract', tuple(args.extract)
         else:
-            # For WAV files, calculate duration from raw audio data
-            bytes_per_sample = cutter.sample_width * cutter.channels
-            samples = len(result_audio) // bytes_per_sample
-            output_duration_ms = int((samples / cutter.sample_rate) * 1000)
+            operation, times = None, ()
         
-        print(f"Output duration: {format_duration(output_duration_ms)} ({output_duration_ms} ms)")
+        process_file(args.input_file, operation, times, args.output, **options)
         
     except (FileNotFoundError, ValueError) as e:
         print(f"Error: {e}", file=sys.stderr)
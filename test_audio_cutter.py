@@ -0,0 +1,204 @@
+import struct
+import wave
+
+import pytest
+
+import audio_cutter
+from audio_cutter import AudioCutter, parse_time, read_manifest, _probe_wav_header
+
+SAMPLE_RATE = 8000
+
+
+def write_wav(path, frames, channels=1, sample_rate=SAMPLE_RATE):
+    # 16-bit samples numbered 0, 1, 2, ... so cuts can be checked exactly
+    with wave.open(str(path), 'wb') as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(b''.join(struct.pack('<h', n % 32768) for n in range(frames * channels)))
+    return path
+
+
+def write_riff(path, chunks):
+    body = b'WAVE' + b''.join(chunk_id + struct.pack('<I', len(data)) + data + b'\0' * (len(data) & 1)
+                              for chunk_id, data in chunks)
+    path.write_bytes(b'RIFF' + struct.pack('<I', len(body)) + body)
+    return path
+
+
+def pcm_fmt(format_tag=1, channels=1, sample_rate=SAMPLE_RATE, bits=16):
+    block_align = channels * bits // 8
+    return struct.pack('<HHIIHH', format_tag, channels, sample_rate, sample_rate * block_align,
+                       block_align, bits)
+
+
+def extensible_fmt(sub_format, channels=1, bits=16):
+    guid = struct.pack('<H', sub_format) + b'\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71'
+    return pcm_fmt(0xFFFE, channels, bits=bits) + struct.pack('<HHI', 22, bits, 0) + guid
+
+
+def read_samples(path):
+    with wave.open(str(path), 'rb') as wav:
+        data = wav.readframes(wav.getnframes())
+    return [sample for sample, in struct.iter_unpack('<h', data)]
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('5', 5000),
+    ('5s', 5000),
+    ('75.5', 75500),
+    ('.5', 500),
+    ('5.', 5000),
+    ('500ms', 500),
+    ('15m', 900000),
+    ('1:30', 90000),
+    ('1:23:45', 5025000),
+    ('0:01.25', 1250),
+])
+def test_parse_time(text, expected):
+    assert parse_time(text) == expected
+
+
+@pytest.mark.parametrize('text', ['', 'abc', '5h', '1:2:3:4', '-5', '.', '1..5', '5 s'])
+def test_parse_time_rejects_invalid(text):
+    with pytest.raises(ValueError):
+        parse_time(text)
+
+
+def test_probe_canonical_wav(tmp_path):
+    path = write_wav(tmp_path / 'a.wav', 1000, channels=2)
+    assert _probe_wav_header(path) == (SAMPLE_RATE, 2, 2, 1000, 44)
+
+
+def test_probe_skips_padded_chunks(tmp_path):
+    path = write_riff(tmp_path / 'a.wav', [(b'fmt ', pcm_fmt()), (b'LIST', b'odd'), (b'data', b'\0' * 20)])
+    # 12 + 24 (fmt) + 12 (LIST, padded to even) + 8
+    assert _probe_wav_header(path) == (SAMPLE_RATE, 1, 2, 10, 56)
+
+
+def test_probe_clamps_unset_data_size(tmp_path):
+    path = write_riff(tmp_path / 'a.wav', [(b'fmt ', pcm_fmt()), (b'data', b'\0' * 20)])
+    raw = bytearray(path.read_bytes())
+    struct.pack_into('<I', raw, 40, 0xFFFFFFFF)
+    path.write_bytes(raw)
+    assert _probe_wav_header(path)[3] == 10
+
+
+def test_probe_accepts_extensible_pcm(tmp_path):
+    path = write_riff(tmp_path / 'a.wav', [(b'fmt ', extensible_fmt(1)), (b'data', b'\0' * 20)])
+    assert _probe_wav_header(path) == (SAMPLE_RATE, 1, 2, 10, 68)
+
+
+@pytest.mark.parametrize('fmt', [pcm_fmt(3, bits=32), extensible_fmt(3, bits=32)],
+                         ids=['float', 'extensible-float'])
+def test_probe_rejects_float(tmp_path, fmt):
+    path = write_riff(tmp_path / 'a.wav', [(b'fmt ', fmt), (b'data', b'\0' * 32)])
+    with pytest.raises(ValueError):
+        _probe_wav_header(path)
+
+
+def test_probe_rejects_truncated_header(tmp_path):
+    path = tmp_path / 'a.wav'
+    path.write_bytes(write_wav(tmp_path / 'full.wav', 100).read_bytes()[:30])
+    with pytest.raises(ValueError):
+        _probe_wav_header(path)
+
+
+def test_probe_rejects_data_before_fmt(tmp_path):
+    path = write_riff(tmp_path / 'a.wav', [(b'data', b'\0' * 20), (b'fmt ', pcm_fmt())])
+    with pytest.raises(ValueError):
+        _probe_wav_header(path)
+
+
+@pytest.mark.parametrize('fmt', [pcm_fmt(sample_rate=0), pcm_fmt(channels=0), pcm_fmt(bits=0)],
+                         ids=['sample-rate', 'channels', 'bits'])
+def test_probe_rejects_zero_fields(tmp_path, fmt):
+    path = write_riff(tmp_path / 'a.wav', [(b'fmt ', fmt), (b'data', b'\0' * 20)])
+    with pytest.raises(ValueError):
+        _probe_wav_header(path)
+
+
+@pytest.fixture(params=[True, False], ids=['sendfile', 'mmap'])
+def copy_path(request, monkeypatch):
+    monkeypatch.setattr(audio_cutter, 'SENDFILE_TO_FILES', request.param and audio_cutter.SENDFILE_TO_FILES)
+
+
+@pytest.mark.parametrize('operation, args, kept', [
+    ('cut_from_front', (250,), [(2000, 8000)]),
+    ('cut_from_back', (250,), [(0, 6000)]),
+    ('cut_from_middle', (250, 500), [(0, 2000), (4000, 8000)]),
+    ('cut_from_middle', (0, 500), [(4000, 8000)]),
+    ('extract_segment', (125, 625), [(1000, 5000)]),
+    ('extract_segment', (0, 1000), [(0, 8000)]),
+])
+def test_wav_cut_frames(tmp_path, copy_path, operation, args, kept):
+    source = write_wav(tmp_path / 'in.wav', 8000)
+    cutter = AudioCutter(source)
+    assert cutter.backend == 'wave'
+    output = cutter.save_audio(getattr(cutter, operation)(*args), tmp_path / 'out.wav')
+    expected = [sample for start, end in kept for sample in range(start, end)]
+    assert read_samples(output) == expected
+
+
+def test_wav_cut_rounds_down_to_frames(tmp_path):
+    # 1 ms at 44.1 kHz is 44.1 frames
+    source = write_wav(tmp_path / 'in.wav', 4410, sample_rate=44100)
+    cutter = AudioCutter(source)
+    output = cutter.save_audio(cutter.extract_segment(1, 3), tmp_path / 'out.wav')
+    assert read_samples(output) == list(range(44, 132))
+
+
+def test_wav_cut_keeps_channels_interleaved(tmp_path, copy_path):
+    source = write_wav(tmp_path / 'in.wav', 8000, channels=2)
+    cutter = AudioCutter(source)
+    output = cutter.save_audio(cutter.cut_from_front(500), tmp_path / 'out.wav')
+    with wave.open(str(output), 'rb') as wav:
+        assert (wav.getnchannels(), wav.getnframes()) == (2, 4000)
+    assert read_samples(output)[:4] == [8000, 8001, 8002, 8003]
+
+
+@pytest.mark.parametrize('operation, args', [
+    ('cut_from_front', (0,)),
+    ('cut_from_front', (1000,)),
+    ('cut_from_back', (1000,)),
+    ('cut_from_middle', (500, 500)),
+    ('extract_segment', (500, 1001)),
+    ('extract_segment', (-1, 500)),
+])
+def test_wav_cut_rejects_bad_ranges(tmp_path, operation, args):
+    cutter = AudioCutter(write_wav(tmp_path / 'in.wav', 8000))
+    with pytest.raises(ValueError):
+        getattr(cutter, operation)(*args)
+
+
+def test_truncate_from_back(tmp_path):
+    source = write_wav(tmp_path / 'in.wav', 8000)
+    cutter = AudioCutter(source)
+    cutter.truncate_from_back(250)
+    assert cutter.get_duration() == 750
+    assert read_samples(source) == list(range(6000))
+
+
+def test_read_manifest(tmp_path):
+    manifest = tmp_path / 'jobs.tsv'
+    manifest.write_text("# input\toperation\ttimes\toutput\n"
+                        "\n"
+                        "a.mp3\tcut-front\t10s\tout/a.mp3\n"
+                        "b.wav\textract\t1:00 2:30\tout/b.wav\r\n")
+    assert read_manifest(manifest) == [
+        ('a.mp3', 'cut-front', ('10s',), 'out/a.mp3'),
+        ('b.wav', 'extract', ('1:00', '2:30'), 'out/b.wav'),
+    ]
+
+
+@pytest.mark.parametrize('line, message', [
+    ("a.mp3\tcut-front\t10s\n", 'expected 4'),
+    ("a.mp3\ttrim\t10s\tout.mp3\n", "unknown operation 'trim'"),
+    ("a.mp3\tcut-middle\t10s\tout.mp3\n", "takes 2 time"),
+])
+def test_read_manifest_rejects_bad_lines(tmp_path, line, message):
+    manifest = tmp_path / 'jobs.tsv'
+    manifest.write_text("# header\n" + line)
+    with pytest.raises(ValueError, match=message) as error:
+        read_manifest(manifest)
+    assert ':2:' in str(error.value)